@@ -1,6 +1,7 @@
 from django.contrib import admin
 from django.utils.html import format_html
-from django.db.models import Avg, Count, Sum
+from django.db import connection
+from django.db.models import Avg, CharField, Count, F, Func, Sum
 from .models import (
     UserSession,
     RetentionCohort,
@@ -9,10 +10,29 @@ from .models import (
     PageView,
     AutomatedReport,
     ReportExecution,
-    NFTMetadata
+    NFTMetadata,
+    UserSegmentMembership,
 )
 
 
+def duration_to_char(field):
+    """Format an interval column as HH:MM:SS in PostgreSQL"""
+    # Re-express the interval in seconds so HH24 also counts whole days
+    return Func(
+        F(field),
+        template="to_char(interval '1 second' * EXTRACT(EPOCH FROM %(expressions)s), 'HH24:MI:SS')",
+        output_field=CharField(),
+    )
+
+
+def format_duration(duration):
+    """Format a timedelta as HH:MM:SS"""
+    total_seconds = int(duration.total_seconds())
+    hours, remainder = divmod(total_seconds, 3600)
+    minutes, seconds = divmod(remainder, 60)
+    return f"{hours:02d}:{minutes:02d}:{seconds:02d}"
+
+
 @admin.register(NFTMetadata)
 class NFTMetadataAdmin(admin.ModelAdmin):
     list_display = ('ipfs_cid', 'content_type', 'authenticity_score', 'copyright_risk')
@@ -23,10 +43,14 @@ class NFTMetadataAdmin(admin.ModelAdmin):
     actions = ['reanalyze_metadata']
     
     def reanalyze_metadata(self, request, queryset):
+        from celery import group
         from .tasks import analyze_nft_metadata
-        for item in queryset:
-            analyze_nft_metadata.delay(item.ipfs_cid)
-        self.message_user(request, f"Scheduled {queryset.count()} items for reanalysis")
+
+        ipfs_cids = list(queryset.values_list('ipfs_cid', flat=True))
+        if ipfs_cids:
+            # Publish every subtask over a single producer connection
+            group(analyze_nft_metadata.s(cid) for cid in ipfs_cids).apply_async()
+        self.message_user(request, f"Scheduled {len(ipfs_cids)} items for reanalysis")
 
 
 @admin.register(UserSession)
@@ -41,22 +65,39 @@ class UserSessionAdmin(admin.ModelAdmin):
         "is_active",
     ]
     list_filter = ["is_active", "login_at", "geographic_region"]
-    search_fields = ["user__username", "user__email", "ip_address"]
-    readonly_fields = ["id", "session_duration"]
+    search_fields = ["user__wallet_address", "user__email", "ip_address"]
+    readonly_fields = ["id", "token", "session_duration"]
     date_hierarchy = "login_at"
 
     def session_duration_display(self, obj):
         if obj.session_duration:
-            total_seconds = int(obj.session_duration.total_seconds())
-            hours, remainder = divmod(total_seconds, 3600)
-            minutes, seconds = divmod(remainder, 60)
-            return f"{hours:02d}:{minutes:02d}:{seconds:02d}"
+            return getattr(obj, "duration_str", None) or format_duration(
+                obj.session_duration
+            )
         return "Active"
 
     session_duration_display.short_description = "Duration"
 
     def get_queryset(self, request):
-        return super().get_queryset(request).select_related("user")
+        queryset = (
+            super()
+            .get_queryset(request)
+            .select_related("user")
+            .defer("user_agent")
+        )
+        if connection.vendor == "postgresql":
+            queryset = queryset.annotate(
+                duration_str=duration_to_char("session_duration")
+            )
+        return queryset
+
+
+# Indexed by RetentionCohort.retention_bucket (low, medium, high)
+_COLOR_SPAN = (
+    '<span style="color: red;">{}%</span>',
+    '<span style="color: orange;">{}%</span>',
+    '<span style="color: green;">{}%</span>',
+)
 
 
 @admin.register(RetentionCohort)
@@ -69,20 +110,16 @@ class RetentionCohortAdmin(admin.ModelAdmin):
         "retained_users",
         "retention_rate_display",
     ]
-    list_filter = ["period_type", "cohort_date"]
+    list_filter = ["period_type", "retention_bucket", "cohort_date"]
     ordering = ["-cohort_date", "period_number"]
 
     def retention_rate_display(self, obj):
-        color = (
-            "green"
-            if obj.retention_rate >= 50
-            else "orange" if obj.retention_rate >= 25 else "red"
-        )
         return format_html(
-            '<span style="color: {};">{:.2f}%</span>', color, obj.retention_rate
+            _COLOR_SPAN[obj.retention_bucket], f"{obj.retention_rate:.2f}"
         )
 
     retention_rate_display.short_description = "Retention Rate"
+    retention_rate_display.admin_order_field = "retention_rate"
 
 
 @admin.register(WalletConnection)
@@ -95,9 +132,17 @@ class WalletConnectionAdmin(admin.ModelAdmin):
         "wallet_address_short",
     ]
     list_filter = ["wallet_provider", "connection_status", "attempted_at"]
-    search_fields = ["user__username", "wallet_address", "wallet_provider"]
+    search_fields = ["user__wallet_address", "wallet_address", "wallet_provider"]
     date_hierarchy = "attempted_at"
 
+    def get_search_results(self, request, queryset, search_term):
+        # Fast path: a full address is matched on the indexed binary column
+        # instead of a substring scan; partial addresses use search_fields
+        address = WalletConnection.address_to_bytes(search_term.strip())
+        if address is not None:
+            return queryset.filter(wallet_address_bin=address), False
+        return super().get_search_results(request, queryset, search_term)
+
     def wallet_address_short(self, obj):
         if obj.wallet_address:
             return f"{obj.wallet_address[:6]}...{obj.wallet_address[-4:]}"
@@ -106,7 +151,12 @@ class WalletConnectionAdmin(admin.ModelAdmin):
     wallet_address_short.short_description = "Wallet Address"
 
     def get_queryset(self, request):
-        return super().get_queryset(request).select_related("user")
+        return (
+            super()
+            .get_queryset(request)
+            .select_related("user")
+            .defer("error_message", "user_agent")
+        )
 
 
 @admin.register(UserBehaviorMetrics)
@@ -120,7 +170,7 @@ class UserBehaviorMetricsAdmin(admin.ModelAdmin):
         "preferred_wallet",
     ]
     list_filter = ["is_returning_user", "preferred_wallet", "first_login"]
-    search_fields = ["user__username", "user__email"]
+    search_fields = ["user__wallet_address", "user__email"]
     readonly_fields = [
         "first_login",
         "last_login",
@@ -130,13 +180,13 @@ class UserBehaviorMetricsAdmin(admin.ModelAdmin):
         "days_since_first_login",
         "last_updated",
     ]
+    list_select_related = ["user"]
 
     def average_session_duration_display(self, obj):
         if obj.average_session_duration:
-            total_seconds = int(obj.average_session_duration.total_seconds())
-            hours, remainder = divmod(total_seconds, 3600)
-            minutes, seconds = divmod(remainder, 60)
-            return f"{hours:02d}:{minutes:02d}:{seconds:02d}"
+            return getattr(obj, "duration_str", None) or format_duration(
+                obj.average_session_duration
+            )
         return "N/A"
 
     average_session_duration_display.short_description = "Avg Duration"
@@ -144,12 +194,19 @@ class UserBehaviorMetricsAdmin(admin.ModelAdmin):
     actions = ["update_metrics"]
 
     def update_metrics(self, request, queryset):
-        for metrics in queryset:
-            metrics.update_metrics()
-        self.message_user(request, f"Updated metrics for {queryset.count()} users.")
+        metrics_list = UserBehaviorMetrics.refresh_many(queryset)
+        self.message_user(request, f"Updated metrics for {len(metrics_list)} users.")
 
     update_metrics.short_description = "Update selected user metrics"
 
+    def get_queryset(self, request):
+        queryset = super().get_queryset(request).select_related("user")
+        if connection.vendor == "postgresql":
+            queryset = queryset.annotate(
+                duration_str=duration_to_char("average_session_duration")
+            )
+        return queryset
+
 
 @admin.register(PageView)
 class PageViewAdmin(admin.ModelAdmin):
@@ -162,7 +219,7 @@ class PageViewAdmin(admin.ModelAdmin):
         "timestamp",
     ]
     list_filter = ["method", "status_code", "timestamp"]
-    search_fields = ["user__username", "path", "ip_address"]
+    search_fields = ["user__wallet_address", "path", "ip_address"]
     date_hierarchy = "timestamp"
 
     def user_display(self, obj):
@@ -171,7 +228,12 @@ class PageViewAdmin(admin.ModelAdmin):
     user_display.short_description = "User"
 
     def get_queryset(self, request):
-        return super().get_queryset(request).select_related("user", "session")
+        return (
+            super()
+            .get_queryset(request)
+            .select_related("user")
+            .defer("user_agent")
+        )
 
 
 @admin.register(AutomatedReport)
@@ -202,12 +264,16 @@ class AutomatedReportAdmin(admin.ModelAdmin):
         })
     )
 
+    def get_queryset(self, request):
+        return super().get_queryset(request).defer('recipients', 'template_config')
+
 @admin.register(ReportExecution)
 class ReportExecutionAdmin(admin.ModelAdmin):
     list_display = ['report', 'status', 'started_at', 'completed_at', 'data_points_processed']
     list_filter = ['status', 'started_at']
     search_fields = ['report__report_type']
     readonly_fields = ['started_at', 'completed_at']
+    list_select_related = ['report']
     
     fieldsets = (
         ('Execution Info', {
@@ -224,3 +290,23 @@ class ReportExecutionAdmin(admin.ModelAdmin):
             'classes': ('collapse',)
         })
     )
+
+    def get_queryset(self, request):
+        return (
+            super()
+            .get_queryset(request)
+            .select_related('report')
+            .defer('error_message', 'report__recipients', 'report__template_config')
+        )
+
+
+@admin.register(UserSegmentMembership)
+class UserSegmentMembershipAdmin(admin.ModelAdmin):
+    list_display = ['user', 'segment', 'joined_at', 'last_evaluated']
+    list_filter = ['segment', 'joined_at']
+    search_fields = ['user__wallet_address', 'segment__name']
+    readonly_fields = ['joined_at', 'last_evaluated']
+    list_select_related = ['user', 'segment']
+
+    def get_queryset(self, request):
+        return super().get_queryset(request).select_related('user', 'segment')
@@ -0,0 +1,39 @@
+from itertools import islice
+
+import pandas as pd
+from django.db import models
+
+
+def queryset_to_dataframe(qs, fields=None, chunk_size=10_000, index_col='id'):
+    """
+    Stream a queryset into a DataFrame without instantiating model objects
+    """
+    if fields is None:
+        fields = [f.attname for f in qs.model._meta.concrete_fields]
+
+    decimal_cols = [
+        f.attname for f in qs.model._meta.concrete_fields
+        if isinstance(f, models.DecimalField) and f.attname in fields
+    ]
+
+    # Rows come through a server-side cursor, so only one chunk of tuples
+    # is alive at a time before it is packed into a columnar frame
+    rows = qs.values_list(*fields).iterator(chunk_size=chunk_size)
+    frames = []
+    while True:
+        chunk = list(islice(rows, chunk_size))
+        if not chunk:
+            break
+        frame = pd.DataFrame.from_records(chunk, columns=fields)
+        for col in decimal_cols:
+            frame[col] = pd.to_numeric(frame[col])
+        frames.append(frame)
+
+    if frames:
+        df = pd.concat(frames, ignore_index=True)
+    else:
+        df = pd.DataFrame(columns=fields)
+
+    if index_col in df.columns:
+        df = df.set_index(index_col)
+    return df
@@ -2,6 +2,7 @@ from rest_framework import viewsets, status
 from rest_framework.decorators import action
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
+from django.db.models import Q
 from django.utils import timezone
 from datetime import timedelta
 from .models import AnomalyDetection, AnomalyModel, NFTTransaction, UserBehaviorProfile
@@ -198,7 +199,7 @@ class NFTTransactionViewSet(viewsets.ReadOnlyModelViewSet):
         address = self.request.query_params.get('address')
         if address:
             queryset = queryset.filter(
-                models.Q(buyer_address=address) | models.Q(seller_address=address)
+                Q(buyer_address=address) | Q(seller_address=address)
             )
         
         return queryset
@@ -222,11 +223,12 @@ class NFTTransactionViewSet(viewsets.ReadOnlyModelViewSet):
         
         # Daily volume aggregation
         daily_volumes = {}
-        for tx in queryset:
-            day_key = tx.timestamp.date()
+        rows = queryset.values_list('timestamp', 'price').iterator(chunk_size=5000)
+        for timestamp, price in rows:
+            day_key = timestamp.date()
             if day_key not in daily_volumes:
                 daily_volumes[day_key] = {'volume': 0, 'count': 0}
-            daily_volumes[day_key]['volume'] += float(tx.price or 0)
+            daily_volumes[day_key]['volume'] += float(price or 0)
             daily_volumes[day_key]['count'] += 1
         
         return Response({
@@ -0,0 +1,68 @@
+"""Coalesced invalidation of the analytics cache.
+
+Model signals only mark the cache as stale. Writes made while serving a
+request are flushed once when the request finishes, and flushes are debounced
+across processes so a burst of writes results in a single invalidation.
+"""
+import logging
+import threading
+
+from django.core.cache import cache
+from django.core.signals import request_finished, request_started
+from django.dispatch import Signal, receiver
+
+from apps.cache.redis_utils import invalidate_analytics_cache
+
+logger = logging.getLogger(__name__)
+
+PENDING_KEY = "analytics_cache_invalidation_pending"
+DEBOUNCE_SECONDS = 1
+
+# Sent every time the analytics cache is actually invalidated
+cache_invalidate = Signal()
+
+_state = threading.local()
+
+
+def request_invalidation():
+    """Mark the analytics cache as stale"""
+    if getattr(_state, "in_request", False):
+        _state.dirty = True
+    else:
+        schedule_invalidation()
+
+
+def invalidate_now():
+    """Invalidate the analytics cache and notify cache_invalidate receivers"""
+    invalidate_analytics_cache()
+    cache_invalidate.send(sender=None)
+
+
+def schedule_invalidation():
+    """Schedule a debounced invalidation unless one is already pending"""
+    if not cache.add(PENDING_KEY, "1", timeout=DEBOUNCE_SECONDS):
+        return
+
+    try:
+        from .tasks import invalidate_analytics_cache_task
+
+        invalidate_analytics_cache_task.apply_async(countdown=DEBOUNCE_SECONDS)
+    except Exception as e:
+        # Fall back to invalidating inline if the broker is unavailable
+        logger.warning(f"Could not schedule analytics cache invalidation: {str(e)}")
+        cache.delete(PENDING_KEY)
+        invalidate_now()
+
+
+@receiver(request_started)
+def begin_request(sender, **kwargs):
+    _state.in_request = True
+    _state.dirty = False
+
+
+@receiver(request_finished)
+def flush_on_request_finished(sender, **kwargs):
+    _state.in_request = False
+    if getattr(_state, "dirty", False):
+        _state.dirty = False
+        schedule_invalidation()
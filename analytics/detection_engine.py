@@ -9,6 +9,14 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# Rows fetched per round trip when streaming transactions from a server-side cursor
+STREAM_CHUNK_SIZE = 5000
+
+TRADE_FIELDS = (
+    'nft_contract', 'token_id', 'buyer_address', 'seller_address',
+    'transaction_hash', 'price', 'timestamp',
+)
+
 class BaseDetector:
     def __init__(self, anomaly_model: AnomalyModel):
         self.model = anomaly_model
@@ -107,7 +115,8 @@ class WashTradingDetector(BaseDetector):
         
         # Group by NFT and analyze trading patterns
         nft_trades = {}
-        for tx in transactions:
+        rows = transactions.values_list(*TRADE_FIELDS, named=True)
+        for tx in rows.iterator(chunk_size=STREAM_CHUNK_SIZE):
             nft_key = f"{tx.nft_contract}:{tx.token_id}"
             if nft_key not in nft_trades:
                 nft_trades[nft_key] = []
@@ -186,7 +195,8 @@ class BiddingAnomalyDetector(BaseDetector):
         
         # Group by NFT
         nft_bids = {}
-        for bid in bids:
+        rows = bids.values_list(*TRADE_FIELDS, named=True)
+        for bid in rows.iterator(chunk_size=STREAM_CHUNK_SIZE):
             nft_key = f"{bid.nft_contract}:{bid.token_id}"
             if nft_key not in nft_bids:
                 nft_bids[nft_key] = []
@@ -251,20 +261,20 @@ class UserBehaviorDetector(BaseDetector):
         if wallet_address:
             profiles = profiles.filter(wallet_address=wallet_address)
         
-        for profile in profiles:
-            # Get recent transactions for this user
-            recent_txs = NFTTransaction.objects.filter(
+        for profile in profiles.iterator(chunk_size=STREAM_CHUNK_SIZE):
+            # Get recent transactions for this user in a single aggregate
+            recent = NFTTransaction.objects.filter(
                 Q(buyer_address=profile.wallet_address) | Q(seller_address=profile.wallet_address),
                 timestamp__gte=start_time,
                 timestamp__lte=end_time
-            )
+            ).aggregate(volume=Sum('price'), count=Count('id'))
             
-            if not recent_txs.exists():
+            if not recent['count']:
                 continue
             
             # Calculate recent behavior metrics
-            recent_volume = sum(float(tx.price or 0) for tx in recent_txs)
-            recent_frequency = recent_txs.count() / (self.lookback_window.total_seconds() / 86400)  # per day
+            recent_volume = float(recent['volume'] or 0)
+            recent_frequency = recent['count'] / (self.lookback_window.total_seconds() / 86400)  # per day
             
             # Compare with historical profile
             volume_deviation = abs(recent_volume - float(profile.avg_transaction_value)) / float(profile.avg_transaction_value) if profile.avg_transaction_value > 0 else 0
@@ -0,0 +1,138 @@
+import select
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+
+
+# NOTIFY channel -> tables whose writes make the cached data stale
+CHANNEL_TABLES = {
+    "sales_changed": ["sales_events", "sales_aggregates"],
+    "minting_changed": ["minting_events"],
+}
+
+# NOTIFY channel -> apps.cache.redis_utils function that evicts its cache
+CHANNEL_INVALIDATORS = {
+    "sales_changed": "invalidate_sales_cache",
+    "minting_changed": "invalidate_minting_cache",
+}
+
+NOTIFY_FUNCTION_SQL = """
+CREATE OR REPLACE FUNCTION notify_cache_changed() RETURNS trigger AS $$
+BEGIN
+    PERFORM pg_notify(TG_ARGV[0], '');
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+"""
+
+
+class Command(BaseCommand):
+    help = "Listen for PostgreSQL change notifications and invalidate the sales and minting caches"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--install-triggers",
+            action="store_true",
+            help="Create (or replace) the notify triggers before listening",
+        )
+        parser.add_argument(
+            "--window",
+            type=float,
+            default=1.0,
+            help="Seconds to coalesce notifications before invalidating (default: 1)",
+        )
+
+    def handle(self, *args, **options):
+        if options["install_triggers"]:
+            self.install_triggers()
+
+        # Nothing else invalidates these caches, so refuse to listen on
+        # channels that no trigger will ever notify
+        self.check_triggers()
+        self.listen(options["window"])
+
+    def install_triggers(self):
+        """Create one statement-level notify trigger per watched table"""
+        self.stdout.write("Installing cache invalidation triggers...")
+
+        with connection.cursor() as cursor:
+            cursor.execute(NOTIFY_FUNCTION_SQL)
+            for channel, tables in CHANNEL_TABLES.items():
+                for table in tables:
+                    # FOR EACH STATEMENT so a bulk write sends one notification
+                    cursor.execute(f"DROP TRIGGER IF EXISTS {table}_cache_notify ON {table};")
+                    cursor.execute(
+                        f"""
+                        CREATE TRIGGER {table}_cache_notify
+                        AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON {table}
+                        FOR EACH STATEMENT EXECUTE FUNCTION notify_cache_changed('{channel}');
+                        """
+                    )
+                    self.stdout.write(f"✓ {table} -> {channel}")
+
+    def check_triggers(self):
+        """Raise CommandError unless every watched table has its notify trigger"""
+        expected = [
+            f"{table}_cache_notify"
+            for tables in CHANNEL_TABLES.values()
+            for table in tables
+        ]
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT tgname FROM pg_trigger WHERE NOT tgisinternal AND tgname = ANY(%s);",
+                [expected],
+            )
+            installed = {row[0] for row in cursor.fetchall()}
+
+        missing = [name for name in expected if name not in installed]
+        if missing:
+            raise CommandError(
+                f"Cache invalidation triggers are missing: {', '.join(missing)}. "
+                "Run this command with --install-triggers."
+            )
+
+    def listen(self, window):
+        """Coalesce notifications over `window` seconds and invalidate once per channel"""
+        connection.ensure_connection()
+        pg_conn = connection.connection
+        if not hasattr(pg_conn, "poll"):
+            raise CommandError("listen_cache_invalidations requires the psycopg2 driver")
+
+        with connection.cursor() as cursor:
+            for channel in CHANNEL_TABLES:
+                cursor.execute(f"LISTEN {channel};")
+
+        self.stdout.write(
+            self.style.SUCCESS(f"Listening on {', '.join(CHANNEL_TABLES)}")
+        )
+
+        pending = set()
+        deadline = None
+
+        while True:
+            timeout = max(0.0, deadline - time.monotonic()) if pending else None
+            readable, _, _ = select.select([pg_conn], [], [], timeout)
+
+            if readable:
+                pg_conn.poll()
+                while pg_conn.notifies:
+                    notify = pg_conn.notifies.pop(0)
+                    if not pending:
+                        deadline = time.monotonic() + window
+                    pending.add(notify.channel)
+
+            if pending and time.monotonic() >= deadline:
+                self.invalidate(pending)
+                pending = set()
+
+    def invalidate(self, channels):
+        """Evict the caches behind the given channels"""
+        from apps.cache import redis_utils
+
+        for channel in channels:
+            try:
+                getattr(redis_utils, CHANNEL_INVALIDATORS[channel])()
+            except Exception as e:
+                # Keep listening; the next write will retry the invalidation
+                self.stderr.write(f"Failed to invalidate cache for {channel}: {str(e)}")
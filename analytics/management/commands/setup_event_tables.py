@@ -0,0 +1,85 @@
+from django.core.management.base import BaseCommand
+from django.db import connection
+
+from minting.models import MintingEvent
+from sales.models import SalesEvent
+
+
+# The sales and minting apps have no migrations, so the indexes and
+# constraints declared in Meta are installed here on databases whose tables
+# already exist
+EVENT_MODELS = [SalesEvent, MintingEvent]
+
+
+class Command(BaseCommand):
+    help = "Install the Meta indexes and constraints of the sales and minting event tables"
+
+    def handle(self, *args, **options):
+        self.stdout.write("Setting up event tables...")
+
+        with connection.cursor() as cursor:
+            tables = connection.introspection.table_names(cursor)
+
+        for model in EVENT_MODELS:
+            table = model._meta.db_table
+            if table not in tables:
+                self.stdout.write(
+                    self.style.WARNING(f"⚠ Table {table} does not exist, skipping...")
+                )
+                continue
+            self.install_indexes(model)
+            self.install_constraints(model)
+
+        self.stdout.write(self.style.SUCCESS("Event table setup completed!"))
+
+    def existing_names(self, model):
+        with connection.cursor() as cursor:
+            return set(
+                connection.introspection.get_constraints(cursor, model._meta.db_table)
+            )
+
+    def install_indexes(self, model):
+        """Create missing indexes without blocking writes to the table"""
+        existing = self.existing_names(model)
+
+        # CREATE INDEX CONCURRENTLY can't run inside a transaction
+        with connection.schema_editor(atomic=False) as schema_editor:
+            for index in model._meta.indexes:
+                if index.name in existing:
+                    self.stdout.write(f"✓ {index.name} already exists")
+                    continue
+
+                schema_editor.execute(
+                    index.create_sql(model, schema_editor, concurrently=True)
+                )
+                self.stdout.write(self.style.SUCCESS(f"✓ Created {index.name}"))
+
+    def install_constraints(self, model):
+        """Add missing check constraints, then validate them against existing rows"""
+        existing = self.existing_names(model)
+
+        with connection.schema_editor() as schema_editor:
+            for constraint in model._meta.constraints:
+                if constraint.name in existing:
+                    self.stdout.write(f"✓ {constraint.name} already exists")
+                    continue
+
+                # NOT VALID takes only a brief lock; the separate VALIDATE
+                # scans the table without blocking writes
+                schema_editor.execute(
+                    f"{constraint.create_sql(model, schema_editor)} NOT VALID"
+                )
+                self.stdout.write(self.style.SUCCESS(f"✓ Added {constraint.name}"))
+
+        for constraint in model._meta.constraints:
+            try:
+                with connection.cursor() as cursor:
+                    cursor.execute(
+                        f"ALTER TABLE {connection.ops.quote_name(model._meta.db_table)} "
+                        f"VALIDATE CONSTRAINT {connection.ops.quote_name(constraint.name)};"
+                    )
+            except Exception as e:
+                # New rows are still checked; existing violations need cleaning up
+                self.stdout.write(
+                    self.style.ERROR(f"✗ Existing rows violate {constraint.name}: {e}")
+                )
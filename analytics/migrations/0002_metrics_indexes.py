@@ -0,0 +1,27 @@
+# Generated by Django 5.2.3
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("analytics", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="usersession",
+            index=models.Index(
+                condition=models.Q(("logout_at__isnull", False)),
+                fields=["user"],
+                name="session_user_completed_ix",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="walletconnection",
+            index=models.Index(
+                fields=["user", "connection_status"], name="wallet_user_status_ix"
+            ),
+        ),
+    ]
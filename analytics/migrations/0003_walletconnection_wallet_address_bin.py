@@ -0,0 +1,49 @@
+# Generated by Django 5.2.3
+
+import re
+
+from django.db import migrations, models
+
+# Same pattern as analytics.models.WALLET_ADDRESS_RE
+WALLET_ADDRESS_RE = r"^0x[0-9a-fA-F]{40}$"
+
+
+def backfill_wallet_address_bin(apps, schema_editor):
+    WalletConnection = apps.get_model("analytics", "WalletConnection")
+    batch = []
+    rows = WalletConnection.objects.exclude(wallet_address="").only("id", "wallet_address")
+    for connection in rows.iterator(chunk_size=2000):
+        if not re.fullmatch(WALLET_ADDRESS_RE, connection.wallet_address):
+            continue
+        connection.wallet_address_bin = bytes.fromhex(connection.wallet_address[2:])
+        batch.append(connection)
+        if len(batch) >= 2000:
+            WalletConnection.objects.bulk_update(batch, ["wallet_address_bin"])
+            batch = []
+    if batch:
+        WalletConnection.objects.bulk_update(batch, ["wallet_address_bin"])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("analytics", "0002_metrics_indexes"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="walletconnection",
+            name="wallet_address_bin",
+            field=models.BinaryField(
+                blank=True, editable=False, max_length=20, null=True
+            ),
+        ),
+        # Decoded in Python so the backfill runs on every database backend
+        migrations.RunPython(backfill_wallet_address_bin, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name="walletconnection",
+            index=models.Index(
+                fields=["wallet_address_bin"], name="wallet_address_bin_ix"
+            ),
+        ),
+    ]
@@ -0,0 +1,31 @@
+# Generated by Django 5.2.3
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("analytics", "0003_walletconnection_wallet_address_bin"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="retentioncohort",
+            name="retention_bucket",
+            field=models.PositiveSmallIntegerField(
+                choices=[(0, "Low"), (1, "Medium"), (2, "High")], default=0
+            ),
+        ),
+        migrations.RunSQL(
+            sql="""
+                UPDATE analytics_retentioncohort
+                SET retention_bucket = CASE
+                    WHEN retention_rate >= 50 THEN 2
+                    WHEN retention_rate >= 25 THEN 1
+                    ELSE 0
+                END;
+            """,
+            reverse_sql=migrations.RunSQL.noop,
+        ),
+    ]
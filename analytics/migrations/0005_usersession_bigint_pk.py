@@ -0,0 +1,93 @@
+# Generated by Django 5.2.3
+
+from django.db import migrations, models
+import django.db.models.deletion
+import uuid
+
+
+class Migration(migrations.Migration):
+    """
+    Replace the random UUID primary key of UserSession with a sequential
+    bigint. The old UUIDs are kept in the new ``token`` column and
+    ``PageView.session_id`` is remapped to the new keys.
+
+    ``setup_timescaledb`` partitions ``analytics_usersession`` on ``login_at``
+    and TimescaleDB requires every unique index to contain it, so the primary
+    key is ``(id, login_at)`` and ``token`` is indexed but not unique. Nothing
+    unique remains on ``id`` alone for a foreign key to reference, so
+    ``PageView.session`` is kept without a database constraint. Django keeps
+    treating ``id`` as the primary key.
+
+    This migration cannot be reversed.
+    """
+
+    dependencies = [
+        ("analytics", "0004_retentioncohort_retention_bucket"),
+    ]
+
+    operations = [
+        migrations.SeparateDatabaseAndState(
+            database_operations=[
+                migrations.RunSQL(
+                    sql="""
+                        ALTER TABLE analytics_usersession ADD COLUMN token uuid;
+                        UPDATE analytics_usersession SET token = id;
+                        ALTER TABLE analytics_usersession ALTER COLUMN token SET NOT NULL;
+                        CREATE INDEX analytics_usersession_token_6ae84c03
+                            ON analytics_usersession (token);
+
+                        ALTER TABLE analytics_usersession
+                            ADD COLUMN new_id bigint GENERATED BY DEFAULT AS IDENTITY;
+                        ALTER TABLE analytics_pageview ADD COLUMN new_session_id bigint;
+                        UPDATE analytics_pageview AS pv
+                            SET new_session_id = s.new_id
+                            FROM analytics_usersession AS s
+                            WHERE pv.session_id = s.id;
+
+                        ALTER TABLE analytics_pageview DROP COLUMN session_id;
+                        ALTER TABLE analytics_pageview
+                            RENAME COLUMN new_session_id TO session_id;
+                        ALTER TABLE analytics_usersession DROP COLUMN id;
+                        ALTER TABLE analytics_usersession RENAME COLUMN new_id TO id;
+                        ALTER TABLE analytics_usersession ADD PRIMARY KEY (id, login_at);
+
+                        CREATE INDEX analytics_pageview_session_id_e7ae95f5
+                            ON analytics_pageview (session_id);
+                    """,
+                    # Irreversible: the original UUID keys can't be put back
+                    # in place of the bigint keys PageView now references
+                ),
+            ],
+            state_operations=[
+                migrations.AddField(
+                    model_name="usersession",
+                    name="token",
+                    field=models.UUIDField(
+                        db_index=True, default=uuid.uuid4, editable=False
+                    ),
+                ),
+                migrations.AlterField(
+                    model_name="usersession",
+                    name="id",
+                    field=models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                migrations.AlterField(
+                    model_name="pageview",
+                    name="session",
+                    field=models.ForeignKey(
+                        blank=True,
+                        db_constraint=False,
+                        null=True,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="page_views",
+                        to="analytics.usersession",
+                    ),
+                ),
+            ],
+        ),
+    ]
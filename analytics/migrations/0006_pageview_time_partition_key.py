@@ -0,0 +1,31 @@
+# Generated by Django 5.2.3
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+    """
+    Include ``timestamp`` in the page view primary key.
+
+    TimescaleDB requires every unique index on a hypertable to contain the
+    partitioning column, so ``setup_timescaledb`` could not convert
+    ``analytics_pageview`` while its primary key was ``id`` alone. Django keeps
+    treating ``id`` as the primary key; it is still generated by the sequence.
+    """
+
+    dependencies = [
+        ("analytics", "0005_usersession_bigint_pk"),
+    ]
+
+    operations = [
+        migrations.RunSQL(
+            sql="""
+                ALTER TABLE analytics_pageview DROP CONSTRAINT analytics_pageview_pkey;
+                ALTER TABLE analytics_pageview ADD PRIMARY KEY (id, timestamp);
+            """,
+            reverse_sql="""
+                ALTER TABLE analytics_pageview DROP CONSTRAINT analytics_pageview_pkey;
+                ALTER TABLE analytics_pageview ADD PRIMARY KEY (id);
+            """,
+        ),
+    ]
@@ -1,12 +1,16 @@
 from django.db import models
+from django.db.models import Count, DurationField, ExpressionWrapper, F, Max, Min, Q, Sum
 from django.contrib.auth.models import User
 from django.utils import timezone
 from datetime import timedelta
+import re
+from dateutil.relativedelta import relativedelta
 import uuid
 from django.db.models.signals import post_save, post_delete
 from django.dispatch import receiver
-from apps.cache.redis_utils import invalidate_analytics_cache
+from analytics.cache_invalidation import request_invalidation
 from django.contrib.postgres.fields import JSONField
+from django.contrib.postgres.indexes import GinIndex
 from users.models import User  
 from analytics.aggregations.utils import queryset_to_dataframe
 
@@ -20,15 +24,39 @@ class NFTEvent(models.Model):
     from_address = models.CharField(max_length=42, blank=True)
     to_address = models.CharField(max_length=42)
     
+    DATAFRAME_FIELDS = [
+        'id', 'event_type', 'contract_address', 'token_id', 'amount',
+        'price', 'timestamp', 'from_address', 'to_address',
+    ]
+
     @classmethod
     def to_dataframe(cls, **filters):
-        qs = cls.objects.filter(**filters)
-        return queryset_to_dataframe(qs)
+        qs = cls.objects.filter(**filters).order_by()
+        return queryset_to_dataframe(qs, fields=cls.DATAFRAME_FIELDS)
+
+BULK_LOG_BATCH_SIZE = 500
+
+# Timestamp format used in __str__ of the event models
+_TS_FMT = "%Y-%m-%d %H:%M"
+
+
+class AnalyticsEventQuerySet(models.QuerySet):
+    """QuerySet for cache-backed analytics models"""
+
+    def bulk_create(self, objs, *args, **kwargs):
+        # bulk_create skips post_save, so invalidate once for the whole batch
+        created = super().bulk_create(objs, *args, **kwargs)
+        request_invalidation()
+        return created
+
 
 class UserSession(models.Model):
     """Track user session activity"""
 
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    # Sequential BigAutoField primary key keeps inserts on the right edge of
+    # the B-tree; the random token is for external references. The hypertable
+    # can't hold a unique index without login_at, so token is only indexed.
+    token = models.UUIDField(default=uuid.uuid4, db_index=True, editable=False)
     user = models.ForeignKey(User, on_delete=models.CASCADE, related_name="sessions")
     login_at = models.DateTimeField(auto_now_add=True)
     logout_at = models.DateTimeField(null=True, blank=True)
@@ -38,16 +66,30 @@ class UserSession(models.Model):
     session_duration = models.DurationField(null=True, blank=True)
     is_active = models.BooleanField(default=True)
 
+    objects = AnalyticsEventQuerySet.as_manager()
+
     class Meta:
         ordering = ["-login_at"]
         indexes = [
             models.Index(fields=["user", "login_at"]),
             models.Index(fields=["login_at"]),
             models.Index(fields=["is_active"]),
+            models.Index(
+                fields=["user"],
+                condition=Q(logout_at__isnull=False),
+                name="session_user_completed_ix",
+            ),
         ]
 
     def __str__(self):
-        return f"{self.user.username} - {self.login_at.strftime('%Y-%m-%d %H:%M')}"
+        return f"{self.user.username} - {self.login_at.strftime(_TS_FMT)}"
+
+    @classmethod
+    def bulk_log(cls, rows):
+        """Insert many sessions using batched multi-row INSERTs"""
+        return cls.objects.bulk_create(
+            rows, batch_size=BULK_LOG_BATCH_SIZE, ignore_conflicts=True
+        )
 
     def calculate_duration(self):
         """Calculate session duration"""
@@ -74,12 +116,21 @@ class RetentionCohort(models.Model):
         ("monthly", "Monthly"),
     ]
 
+    RETENTION_BUCKETS = [
+        (0, "Low"),
+        (1, "Medium"),
+        (2, "High"),
+    ]
+
     cohort_date = models.DateField()
     period_type = models.CharField(max_length=10, choices=PERIOD_CHOICES)
     total_users = models.IntegerField(default=0)
     period_number = models.IntegerField()  # Days/weeks/months since cohort start
     retained_users = models.IntegerField(default=0)
     retention_rate = models.DecimalField(max_digits=5, decimal_places=2, default=0.00)
+    retention_bucket = models.PositiveSmallIntegerField(
+        choices=RETENTION_BUCKETS, default=0
+    )
     created_at = models.DateTimeField(auto_now_add=True)
 
     class Meta:
@@ -99,9 +150,36 @@ class RetentionCohort(models.Model):
             self.retention_rate = (self.retained_users / self.total_users) * 100
         else:
             self.retention_rate = 0.00
+
+        if self.retention_rate >= 50:
+            self.retention_bucket = 2
+        elif self.retention_rate >= 25:
+            self.retention_bucket = 1
+        else:
+            self.retention_bucket = 0
         return self.retention_rate
 
 
+# A 0x-prefixed, 20-byte Ethereum address
+WALLET_ADDRESS_RE = r"^0x[0-9a-fA-F]{40}$"
+
+
+class WalletConnectionQuerySet(AnalyticsEventQuerySet):
+    """Keeps wallet_address_bin in sync on the write paths that skip save()"""
+
+    def bulk_create(self, objs, *args, **kwargs):
+        objs = list(objs)
+        for obj in objs:
+            obj.wallet_address_bin = self.model.address_to_bytes(obj.wallet_address)
+        return super().bulk_create(objs, *args, **kwargs)
+
+    def update(self, **kwargs):
+        # Only a literal address can be decoded here; expressions are left alone
+        if isinstance(kwargs.get("wallet_address"), str):
+            kwargs["wallet_address_bin"] = self.model.address_to_bytes(kwargs["wallet_address"])
+        return super().update(**kwargs)
+
+
 class WalletConnection(models.Model):
     """Track wallet connection attempts and preferences"""
 
@@ -127,18 +205,29 @@ class WalletConnection(models.Model):
     wallet_address = models.CharField(
         max_length=42, blank=True
     )  # Ethereum address length
+    # Raw address bytes, half the size of the hex string for indexing and lookups;
+    # NULL unless wallet_address is a well-formed address
+    wallet_address_bin = models.BinaryField(
+        max_length=20, null=True, blank=True, editable=False
+    )
     connection_status = models.CharField(max_length=10, choices=STATUS_CHOICES)
     attempted_at = models.DateTimeField(auto_now_add=True)
     error_message = models.TextField(blank=True)
     ip_address = models.GenericIPAddressField()
     user_agent = models.TextField(blank=True)
 
+    objects = WalletConnectionQuerySet.as_manager()
+
     class Meta:
         ordering = ["-attempted_at"]
         indexes = [
             models.Index(fields=["user", "attempted_at"]),
             models.Index(fields=["wallet_provider", "connection_status"]),
             models.Index(fields=["attempted_at"]),
+            models.Index(
+                fields=["user", "connection_status"], name="wallet_user_status_ix"
+            ),
+            models.Index(fields=["wallet_address_bin"], name="wallet_address_bin_ix"),
         ]
 
     def __str__(self):
@@ -146,6 +235,20 @@ class WalletConnection(models.Model):
             f"{self.user.username} - {self.wallet_provider} ({self.connection_status})"
         )
 
+    @staticmethod
+    def address_to_bytes(address):
+        """Decode a 0x-prefixed 20-byte address, or return None if it is malformed"""
+        if not address or not re.fullmatch(WALLET_ADDRESS_RE, address):
+            return None
+        return bytes.fromhex(address[2:])
+
+    def save(self, *args, **kwargs):
+        self.wallet_address_bin = self.address_to_bytes(self.wallet_address)
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None and "wallet_address" in update_fields:
+            kwargs["update_fields"] = {*update_fields, "wallet_address_bin"}
+        super().save(*args, **kwargs)
+
 
 class UserBehaviorMetrics(models.Model):
     """Aggregate user behavior metrics"""
@@ -176,48 +279,104 @@ class UserBehaviorMetrics(models.Model):
     def __str__(self):
         return f"{self.user.username} - Behavior Metrics"
 
+    METRIC_FIELDS = [
+        "first_login",
+        "last_login",
+        "total_sessions",
+        "total_session_time",
+        "average_session_duration",
+        "days_since_first_login",
+        "is_returning_user",
+        "preferred_wallet",
+        "successful_wallet_connections",
+        "failed_wallet_connections",
+        "last_updated",
+    ]
+
     def update_metrics(self):
         """Update user behavior metrics"""
-        sessions = self.user.sessions.all()
-
-        if sessions.exists():
-            self.first_login = sessions.order_by("login_at").first().login_at
-            self.last_login = sessions.order_by("-login_at").first().login_at
-            self.total_sessions = sessions.count()
-
-            # Calculate total session time
-            completed_sessions = sessions.filter(logout_at__isnull=False)
-            if completed_sessions.exists():
-                total_time = sum(
-                    [s.calculate_duration() for s in completed_sessions], timedelta(0)
-                )
-                self.total_session_time = total_time
-                self.average_session_duration = total_time / completed_sessions.count()
-
-            # Calculate days since first login
-            self.days_since_first_login = (
-                timezone.now().date() - self.first_login.date()
-            ).days
-            self.is_returning_user = self.total_sessions > 1
-
-            # Update wallet preferences
-            wallet_connections = self.user.wallet_connections.filter(
-                connection_status="success"
-            )
-            if wallet_connections.exists():
-                # Find most used wallet provider
-                wallet_counts = {}
-                for connection in wallet_connections:
-                    provider = connection.wallet_provider
-                    wallet_counts[provider] = wallet_counts.get(provider, 0) + 1
-
-                self.preferred_wallet = max(wallet_counts, key=wallet_counts.get)
-                self.successful_wallet_connections = wallet_connections.count()
-                self.failed_wallet_connections = self.user.wallet_connections.filter(
-                    connection_status="failed"
-                ).count()
+        type(self).refresh_many([self])
 
-        self.save()
+    @classmethod
+    def refresh_many(cls, metrics, batch_size=500):
+        """Recompute and save the metrics of several users
+
+        Uses one grouped query for session stats and one for wallet stats,
+        however many users are refreshed. Accepts a queryset or a list of
+        instances, which are updated in place; returns the refreshed list.
+        """
+        if isinstance(metrics, models.QuerySet):
+            # Callers such as the changelist join user, which is never read here
+            metrics = metrics.select_related(None)
+        metrics_list = list(metrics)
+        user_ids = [m.user_id for m in metrics_list]
+
+        session_stats = {
+            row["user_id"]: row
+            for row in UserSession.objects.filter(user_id__in=user_ids)
+            .order_by()
+            .values("user_id")
+            .annotate(
+                first=Min("login_at"),
+                last=Max("login_at"),
+                cnt=Count("id"),
+                completed=Count("id", filter=Q(logout_at__isnull=False)),
+                total=Sum(
+                    ExpressionWrapper(
+                        F("logout_at") - F("login_at"), output_field=DurationField()
+                    ),
+                    filter=Q(logout_at__isnull=False),
+                ),
+            )
+        }
+
+        wallet_stats = {}
+        for row in (
+            WalletConnection.objects.filter(user_id__in=user_ids)
+            .order_by()
+            .values("user_id", "wallet_provider", "connection_status")
+            .annotate(c=Count("id"))
+        ):
+            stats = wallet_stats.setdefault(
+                row["user_id"], {"providers": {}, "success": 0, "failed": 0}
+            )
+            if row["connection_status"] == "success":
+                stats["providers"][row["wallet_provider"]] = row["c"]
+                stats["success"] += row["c"]
+            elif row["connection_status"] == "failed":
+                stats["failed"] += row["c"]
+
+        now = timezone.now()
+        for m in metrics_list:
+            stats = session_stats.get(m.user_id)
+            if stats:
+                m.first_login = stats["first"]
+                m.last_login = stats["last"]
+                m.total_sessions = stats["cnt"]
+
+                # Calculate total session time
+                if stats["completed"]:
+                    m.total_session_time = stats["total"] or timedelta(0)
+                    m.average_session_duration = (
+                        m.total_session_time / stats["completed"]
+                    )
+
+                # Calculate days since first login
+                m.days_since_first_login = (now.date() - m.first_login.date()).days
+                m.is_returning_user = m.total_sessions > 1
+
+                # Update wallet preferences
+                wallets = wallet_stats.get(m.user_id)
+                if wallets and wallets["success"]:
+                    # Find most used wallet provider
+                    providers = wallets["providers"]
+                    m.preferred_wallet = max(providers, key=providers.get)
+                    m.successful_wallet_connections = wallets["success"]
+                    m.failed_wallet_connections = wallets["failed"]
+            m.last_updated = now
+
+        cls.objects.bulk_update(metrics_list, cls.METRIC_FIELDS, batch_size=batch_size)
+        return metrics_list
 
 
 class PageView(models.Model):
@@ -226,12 +385,15 @@ class PageView(models.Model):
     user = models.ForeignKey(
         User, on_delete=models.CASCADE, related_name="page_views", null=True, blank=True
     )
+    # No database constraint: the UserSession hypertable has no unique index
+    # on id alone to reference (see migration 0005); deletes still cascade in Django
     session = models.ForeignKey(
         UserSession,
         on_delete=models.CASCADE,
         related_name="page_views",
         null=True,
         blank=True,
+        db_constraint=False,
     )
     path = models.CharField(max_length=255)
     method = models.CharField(max_length=10, default="GET")
@@ -242,6 +404,8 @@ class PageView(models.Model):
     ip_address = models.GenericIPAddressField()
     user_agent = models.TextField(blank=True)
 
+    objects = AnalyticsEventQuerySet.as_manager()
+
     class Meta:
         ordering = ["-timestamp"]
         indexes = [
@@ -252,7 +416,14 @@ class PageView(models.Model):
 
     def __str__(self):
         user_str = self.user.username if self.user else "Anonymous"
-        return f"{user_str} - {self.path} ({self.timestamp.strftime('%Y-%m-%d %H:%M')})"
+        return f"{user_str} - {self.path} ({self.timestamp.strftime(_TS_FMT)})"
+
+    @classmethod
+    def bulk_log(cls, rows):
+        """Insert many page views using batched multi-row INSERTs"""
+        return cls.objects.bulk_create(
+            rows, batch_size=BULK_LOG_BATCH_SIZE, ignore_conflicts=True
+        )
 
 
 # Cache Invalidation Signals
@@ -264,9 +435,17 @@ class PageView(models.Model):
 @receiver(post_delete, sender=PageView)
 def invalidate_analytics_cache_signal(sender, instance, **kwargs):
     """
-    Signal handler to invalidate analytics cache when relevant models change
+    Signal handler to invalidate analytics cache when relevant models change.
+    Invalidation is coalesced per request and debounced across processes.
     """
-    invalidate_analytics_cache()
+    request_invalidation()
+
+
+REPORT_FREQUENCY_DELTAS = {
+    'daily': relativedelta(days=1),
+    'weekly': relativedelta(weeks=1),
+    'monthly': relativedelta(months=1),
+}
 
 
 class AutomatedReport(models.Model):
@@ -288,6 +467,10 @@ class AutomatedReport(models.Model):
         indexes = [
             models.Index(fields=['report_type', 'frequency']),
             models.Index(fields=['next_run', 'is_active']),
+            models.Index(fields=['next_run'], condition=Q(is_active=True), name='report_due_ix'),
+            # Serve recipients__contains=[...] / template_config__contains={...}
+            GinIndex(fields=['recipients'], name='report_recipients_gin', opclasses=['jsonb_path_ops']),
+            GinIndex(fields=['template_config'], name='tmplcfg_gin', opclasses=['jsonb_path_ops']),
         ]
     
     def __str__(self):
@@ -299,14 +482,8 @@ class AutomatedReport(models.Model):
             self.next_run = timezone.now()
             return
         
-        if self.frequency == 'daily':
-            self.next_run = self.last_run + timedelta(days=1)
-        elif self.frequency == 'weekly':
-            self.next_run = self.last_run + timedelta(weeks=1)
-        elif self.frequency == 'monthly':
-            # Add one month
-            next_month = self.last_run.replace(day=28) + timedelta(days=4)
-            self.next_run = next_month - timedelta(days=next_month.day-1)
+        # relativedelta clamps month-end dates (Jan 31 -> Feb 28/29)
+        self.next_run = self.last_run + REPORT_FREQUENCY_DELTAS[self.frequency]
 
 
 class ReportExecution(models.Model):
@@ -389,6 +566,10 @@ class UserSegmentMembership(models.Model):
 
     class Meta:
         unique_together = ('user', 'segment')
+        indexes = [
+            models.Index(fields=['segment', 'user']),
+            models.Index(fields=['last_evaluated']),
+        ]
 
     def __str__(self):
         return f"{self.user} in {self.segment}"
@@ -1,40 +1,133 @@
-from celery import shared_task
+from celery import group, shared_task
 from django.utils import timezone
 from datetime import timedelta
 from .detection_engine import AnomalyDetectionEngine
 from .models import AnomalyDetection, AlertWebhook, WebhookLog, UserBehaviorProfile, NFTTransaction
 from .webhook_service import WebhookService
+import hashlib
 import logging
-from django.db import connection
-from redis import Redis
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List
+from django.db import connection, transaction
+from botocore.exceptions import ClientError
+from django.conf import settings
+from django_redis import get_redis_connection
 from .report_generator import ReportGenerator
 from .distribution_service import DistributionService
-from .models import AutomatedReport, ReportExecution
+from .models import AutomatedReport, ReportExecution, REPORT_FREQUENCY_DELTAS
 from .models import NFTMetadata
 from nftopia_analytics.storage.ipfs import IPFSClient
 from .utils import check_authenticity, detect_copyright_issues, check_standardization, \
     determine_content_type
+from django.core.cache import cache
+from django.core.serializers.json import DjangoJSONEncoder
+import json
+from .cache_invalidation import PENDING_KEY, invalidate_now
 
 logger = logging.getLogger(__name__)
 
+# Matches the freshness window of a metadata analysis
+NFT_METADATA_CACHE_TTL = 60 * 60 * 24
 
+AGGREGATE_CACHE_TTL = 60 * 60
 
+# Built once per worker process (see worker_process_init in nftopia_analytics/celery.py)
+_webhook_service = None
+_report_generator = None
+_distribution_service = None
 
 
+def get_webhook_service():
+    global _webhook_service
+    if _webhook_service is None:
+        _webhook_service = WebhookService()
+    return _webhook_service
 
 
+def get_report_generator():
+    global _report_generator
+    if _report_generator is None:
+        _report_generator = ReportGenerator()
+    return _report_generator
+
+
+def get_distribution_service():
+    global _distribution_service
+    if _distribution_service is None:
+        _distribution_service = DistributionService()
+    return _distribution_service
+
+CLEANUP_BATCH_SIZE = 10_000
+
+TEMP_FILE_CLEANUP_WORKERS = 16
+
+
+def _nft_metadata_cache_key(ipfs_cid):
+    return f"nftmeta:{ipfs_cid}"
+
+
+def _cache_nft_metadata_id(ipfs_cid, nft_meta_id, ttl=NFT_METADATA_CACHE_TTL):
+    try:
+        cache.set(_nft_metadata_cache_key(ipfs_cid), nft_meta_id, timeout=ttl)
+    except Exception as e:
+        logger.warning(f"Failed to cache metadata analysis for {ipfs_cid}: {str(e)}")
+
+
+def _archive_raw_metadata(metadata):
+    """Store raw metadata in S3 under its sha256 digest and return (digest, uri)
+
+    Identical metadata maps to the same object, so it is only uploaded once.
+    The uri is None when the archive is unavailable; the caller then keeps
+    the blob inline so the analysis is still stored.
+    """
+    body = json.dumps(metadata, sort_keys=True, cls=DjangoJSONEncoder).encode()
+    digest = hashlib.sha256(body).hexdigest()
+    bucket = getattr(settings, 'NFT_METADATA_S3_BUCKET', 'analytics-raw')
+    key = f"{digest}.json"
+
+    s3_client = get_distribution_service().s3_client
+    if s3_client is None:
+        logger.warning(f"S3 is not configured; raw metadata {digest} was not archived")
+        return digest, None
+
+    try:
+        try:
+            s3_client.head_object(Bucket=bucket, Key=key)
+        except ClientError as e:
+            if e.response.get('Error', {}).get('Code') not in ('404', 'NoSuchKey', 'NotFound'):
+                raise
+            s3_client.put_object(Bucket=bucket, Key=key, Body=body, ContentType='application/json')
+    except Exception as e:
+        logger.warning(f"Failed to archive raw metadata {digest}: {str(e)}")
+        return digest, None
+
+    return digest, f"s3://{bucket}/{key}"
+
 
 @shared_task(bind=True, rate_limit='10/m')  # Rate limiting
 def analyze_nft_metadata(self, ipfs_cid):
+    # Recently analyzed CIDs are answered from the cache without touching the DB
+    try:
+        cached_id = cache.get(_nft_metadata_cache_key(ipfs_cid))
+    except Exception:
+        cached_id = None
+    if cached_id is not None:
+        return int(cached_id)
+    
     ipfs = IPFSClient()
     
     # Check if we already have recent analysis
+    now = timezone.now()
     existing = NFTMetadata.objects.filter(
         ipfs_cid=ipfs_cid,
-        last_analyzed__gte=timezone.now() - timezone.timedelta(days=1)
+        last_analyzed__gte=now - timezone.timedelta(days=1)
     ).first()
     
     if existing:
+        remaining = NFT_METADATA_CACHE_TTL - int((now - existing.last_analyzed).total_seconds())
+        if remaining > 0:
+            _cache_nft_metadata_id(ipfs_cid, existing.id, remaining)
         return existing.id
     
     try:
@@ -48,19 +141,33 @@ def analyze_nft_metadata(self, ipfs_cid):
             'standardization_issues': check_standardization(metadata)
         }
         
+        # Keep only a digest and a pointer to the raw blob in the row, or the
+        # blob itself when it could not be archived
+        digest, uri = _archive_raw_metadata(metadata)
+        
         # Save results
         nft_meta, created = NFTMetadata.objects.update_or_create(
             ipfs_cid=ipfs_cid,
             defaults={
-                'raw_metadata': metadata,
+                'raw_metadata': metadata if uri is None else None,
+                'raw_metadata_digest': digest,
+                'raw_metadata_uri': uri,
                 **analysis
             }
         )
+        _cache_nft_metadata_id(ipfs_cid, nft_meta.id)
         
         return nft_meta.id
     except Exception as e:
         self.retry(exc=e, countdown=60)
 
+@shared_task
+def invalidate_analytics_cache_task():
+    """Run a debounced analytics cache invalidation"""
+    # Clear the marker first so writes made from here on schedule a new run
+    cache.delete(PENDING_KEY)
+    invalidate_now()
+
 @shared_task
 def run_anomaly_detection_task(detection_type=None):
     """Celery task to run anomaly detection"""
@@ -93,17 +200,56 @@ def trigger_webhooks_task():
             detected_at__gte=timezone.now() - timedelta(minutes=5),
             status='pending'
         )
+        anomaly_ids = list(recent_anomalies.values_list('id', flat=True))
         
-        webhook_service = WebhookService()
-        
-        for anomaly in recent_anomalies:
-            webhook_service.send_anomaly_alert(anomaly)
+        # Fan out so slow endpoints are called in parallel across workers
+        if anomaly_ids:
+            group(send_single_webhook.s(anomaly_id) for anomaly_id in anomaly_ids).apply_async()
         
-        logger.info(f"Webhook processing completed for {recent_anomalies.count()} anomalies.")
+        logger.info(f"Webhook processing dispatched for {len(anomaly_ids)} anomalies.")
         
     except Exception as e:
         logger.error(f"Webhook task failed: {str(e)}")
 
+@shared_task
+def send_single_webhook(anomaly_id):
+    """Send webhook alerts for a single anomaly"""
+    try:
+        anomaly = AnomalyDetection.objects.select_related(
+            'anomaly_model', 'transaction'
+        ).get(id=anomaly_id)
+        get_webhook_service().send_anomaly_alert(anomaly)
+    except AnomalyDetection.DoesNotExist:
+        logger.warning(f"Anomaly {anomaly_id} not found, skipping webhooks")
+    except Exception as e:
+        logger.error(f"Webhook delivery failed for anomaly {anomaly_id}: {str(e)}")
+
+# One row per (address, transaction) for every address that traded recently.
+# A transaction where buyer and seller match is only counted once.
+_PROFILE_LEGS_CTE = """
+    WITH recent AS (
+        SELECT buyer_address AS addr FROM {table}
+        WHERE timestamp >= %(start)s AND buyer_address IS NOT NULL AND buyer_address <> ''
+        UNION
+        SELECT seller_address FROM {table}
+        WHERE timestamp >= %(start)s AND seller_address IS NOT NULL AND seller_address <> ''
+    ),
+    legs AS (
+        SELECT buyer_address AS addr, price, timestamp, nft_contract FROM {table}
+        WHERE buyer_address IN (SELECT addr FROM recent)
+        UNION ALL
+        SELECT seller_address, price, timestamp, nft_contract FROM {table}
+        WHERE seller_address IN (SELECT addr FROM recent)
+            AND seller_address IS DISTINCT FROM buyer_address
+    )
+"""
+
+PROFILE_FIELDS = [
+    'avg_transaction_value', 'transaction_frequency', 'total_transactions',
+    'total_volume', 'preferred_collections', 'risk_score', 'last_activity',
+    'updated_at',
+]
+
 @shared_task
 def update_user_behavior_profiles_task():
     """Update user behavior profiles based on recent activity"""
@@ -111,89 +257,80 @@ def update_user_behavior_profiles_task():
         end_time = timezone.now()
         start_time = end_time - timedelta(days=7)  # Look at last 7 days
         
-        # Get all unique wallet addresses from recent transactions
-        recent_addresses = set()
-        recent_txs = NFTTransaction.objects.filter(timestamp__gte=start_time)
-        
-        for tx in recent_txs:
-            if tx.buyer_address:
-                recent_addresses.add(tx.buyer_address)
-            if tx.seller_address:
-                recent_addresses.add(tx.seller_address)
-        
-        updated_profiles = 0
+        legs_cte = _PROFILE_LEGS_CTE.format(table=NFTTransaction._meta.db_table)
+        params = {'start': start_time}
         
-        for address in recent_addresses:
-            profile, created = UserBehaviorProfile.objects.get_or_create(
-                wallet_address=address,
-                defaults={
-                    'first_seen': timezone.now(),
-                    'last_activity': timezone.now()
-                }
-            )
+        # Per-address totals over all transactions of recently active addresses
+        with connection.cursor() as cursor:
+            cursor.execute(legs_cte + """
+                SELECT addr, COUNT(*), COALESCE(SUM(price), 0), MIN(timestamp), MAX(timestamp)
+                FROM legs GROUP BY addr
+            """, params)
+            summaries = cursor.fetchall()
+            
+            cursor.execute(legs_cte + """
+                SELECT addr, nft_contract, COUNT(*) FROM legs GROUP BY addr, nft_contract
+            """, params)
+            collection_rows = cursor.fetchall()
+        
+        collections = {}
+        for address, nft_contract, count in collection_rows:
+            collections.setdefault(address, []).append((nft_contract, count))
+        
+        profiles = []
+        for address, total_count, total_volume, first_ts, last_ts in summaries:
+            total_volume = float(total_volume)
+            
+            # Calculate average transaction value
+            avg_value = total_volume / total_count if total_count > 0 else 0
+            
+            # Calculate frequency (transactions per day)
+            days_active = (last_ts - first_ts).days + 1
+            frequency = total_count / days_active if days_active > 0 else 0
+            
+            # Get preferred collections
+            preferred_collections = sorted(
+                collections.get(address, []),
+                key=lambda x: x[1],
+                reverse=True
+            )[:5]  # Top 5 collections
+            
+            # Calculate risk score (simplified)
+            risk_score = 0.0
+            
+            # High frequency trading increases risk
+            if frequency > 10:  # More than 10 transactions per day
+                risk_score += 0.3
             
-            # Get all transactions for this address
-            user_txs = NFTTransaction.objects.filter(
-                models.Q(buyer_address=address) | models.Q(seller_address=address)
-            )
+            # Large volume increases risk
+            if total_volume > 100:  # More than 100 ETH total volume
+                risk_score += 0.2
             
-            if user_txs.exists():
-                # Calculate metrics
-                total_volume = sum(float(tx.price or 0) for tx in user_txs)
-                total_count = user_txs.count()
-                
-                # Calculate average transaction value
-                avg_value = total_volume / total_count if total_count > 0 else 0
-                
-                # Calculate frequency (transactions per day)
-                first_tx = user_txs.order_by('timestamp').first()
-                last_tx = user_txs.order_by('timestamp').last()
-                
-                if first_tx and last_tx:
-                    days_active = (last_tx.timestamp - first_tx.timestamp).days + 1
-                    frequency = total_count / days_active if days_active > 0 else 0
-                else:
-                    frequency = 0
-                
-                # Get preferred collections
-                collections = {}
-                for tx in user_txs:
-                    if tx.nft_contract not in collections:
-                        collections[tx.nft_contract] = 0
-                    collections[tx.nft_contract] += 1
-                
-                preferred_collections = sorted(
-                    collections.items(), 
-                    key=lambda x: x[1], 
-                    reverse=True
-                )[:5]  # Top 5 collections
-                
-                # Calculate risk score (simplified)
-                risk_score = 0.0
-                
-                # High frequency trading increases risk
-                if frequency > 10:  # More than 10 transactions per day
-                    risk_score += 0.3
-                
-                # Large volume increases risk
-                if total_volume > 100:  # More than 100 ETH total volume
-                    risk_score += 0.2
-                
-                # Few preferred collections (might indicate wash trading)
-                if len(preferred_collections) <= 2 and total_count > 10:
-                    risk_score += 0.3
-                
-                # Update profile
-                profile.avg_transaction_value = avg_value
-                profile.transaction_frequency = frequency
-                profile.total_transactions = total_count
-                profile.total_volume = total_volume
-                profile.preferred_collections = [col[0] for col in preferred_collections]
-                profile.risk_score = min(risk_score, 1.0)
-                profile.last_activity = last_tx.timestamp if last_tx else timezone.now()
-                profile.save()
-                
-                updated_profiles += 1
+            # Few preferred collections (might indicate wash trading)
+            if len(preferred_collections) <= 2 and total_count > 10:
+                risk_score += 0.3
+            
+            profiles.append(UserBehaviorProfile(
+                wallet_address=address,
+                first_seen=end_time,  # Only used when the profile is new
+                avg_transaction_value=avg_value,
+                transaction_frequency=frequency,
+                total_transactions=total_count,
+                total_volume=total_volume,
+                preferred_collections=[col[0] for col in preferred_collections],
+                risk_score=min(risk_score, 1.0),
+                last_activity=last_ts
+            ))
+        
+        # INSERT ... ON CONFLICT (wallet_address) DO UPDATE in batches
+        UserBehaviorProfile.objects.bulk_create(
+            profiles,
+            update_conflicts=True,
+            unique_fields=['wallet_address'],
+            update_fields=PROFILE_FIELDS,
+            batch_size=500
+        )
+        updated_profiles = len(profiles)
         
         logger.info(f"Updated {updated_profiles} user behavior profiles.")
         
@@ -209,22 +346,36 @@ def update_user_behavior_profiles_task():
             'message': str(e)
         }
 
+def _delete_in_batches(queryset, batch_size=CLEANUP_BATCH_SIZE):
+    """Delete a queryset by primary key batches and return the rows removed
+
+    Each batch commits on its own so a large purge doesn't hold one long
+    transaction (and its locks and WAL) open.
+    """
+    model = queryset.model
+    deleted = 0
+    while True:
+        ids = list(queryset.values_list('pk', flat=True)[:batch_size])
+        if not ids:
+            return deleted
+        _, per_model = model.objects.filter(pk__in=ids).delete()
+        deleted += per_model.get(model._meta.label, 0)
+
 @shared_task
 def cleanup_old_data_task():
     """Clean up old anomaly detections and logs"""
     try:
         # Delete anomalies older than 90 days
         cutoff_date = timezone.now() - timedelta(days=90)
-        
-        old_anomalies = AnomalyDetection.objects.filter(detected_at__lt=cutoff_date)
-        deleted_anomalies = old_anomalies.count()
-        old_anomalies.delete()
+        deleted_anomalies = _delete_in_batches(
+            AnomalyDetection.objects.filter(detected_at__lt=cutoff_date)
+        )
         
         # Delete webhook logs older than 30 days
         log_cutoff = timezone.now() - timedelta(days=30)
-        old_logs = WebhookLog.objects.filter(sent_at__lt=log_cutoff)
-        deleted_logs = old_logs.count()
-        old_logs.delete()
+        deleted_logs = _delete_in_batches(
+            WebhookLog.objects.filter(sent_at__lt=log_cutoff)
+        )
         
         logger.info(f"Cleanup completed. Deleted {deleted_anomalies} anomalies and {deleted_logs} webhook logs.")
         
@@ -244,37 +395,37 @@ def cleanup_old_data_task():
 
 @shared_task
 def generate_scheduled_reports_task():
-    """Generate all scheduled reports that are due"""
+    """Dispatch all scheduled reports that are due, one subtask per report"""
     try:
         now = timezone.now()
-        due_reports = AutomatedReport.objects.filter(
-            is_active=True,
-            next_run__lte=now
-        )
-        
-        generator = ReportGenerator()
-        generated_count = 0
-        
-        for report in due_reports:
-            try:
-                execution = generator.generate_report(report)
-                
-                # Update last_run and calculate next_run
-                report.last_run = now
-                report.calculate_next_run()
-                report.save()
-                
-                generated_count += 1
-                logger.info(f"Generated report {report.id}: {execution.status}")
-                
-            except Exception as e:
-                logger.error(f"Failed to generate report {report.id}: {str(e)}")
-        
-        logger.info(f"Scheduled report generation completed. Generated {generated_count} reports.")
+        with transaction.atomic():
+            # Lock the due rows so an overlapping beat run skips them instead
+            # of dispatching the same reports again
+            due_reports = list(AutomatedReport.objects.select_for_update(skip_locked=True).filter(
+                is_active=True,
+                next_run__lte=now
+            ).values_list('id', 'frequency'))
+            
+            if due_reports:
+                group(
+                    generate_single_report_task.s(report_id) for report_id, _ in due_reports
+                ).apply_async()
+            
+            # Advance the schedule only once the reports are enqueued; if the
+            # dispatch fails the transaction rolls back and they stay due
+            for frequency, delta in REPORT_FREQUENCY_DELTAS.items():
+                report_ids = [report_id for report_id, freq in due_reports if freq == frequency]
+                if report_ids:
+                    AutomatedReport.objects.filter(id__in=report_ids).update(
+                        last_run=now,
+                        next_run=now + delta
+                    )
+        
+        logger.info(f"Scheduled report generation dispatched {len(due_reports)} reports.")
         
         return {
             'status': 'success',
-            'reports_generated': generated_count
+            'reports_dispatched': len(due_reports)
         }
         
     except Exception as e:
@@ -289,7 +440,7 @@ def generate_single_report_task(report_id):
     """Generate a single report by ID"""
     try:
         report = AutomatedReport.objects.get(id=report_id)
-        generator = ReportGenerator()
+        generator = get_report_generator()
         execution = generator.generate_report(report)
         
         logger.info(f"Single report generation completed for report {report_id}: {execution.status}")
@@ -313,18 +464,26 @@ def generate_single_report_task(report_id):
             'message': str(e)
         }
 
+def _remove_temp_file(file_path):
+    """Unlink a report temp file, returning 1 if it was removed"""
+    if 'temp_' not in os.path.basename(file_path):
+        return 0
+    try:
+        os.unlink(file_path)
+        return 1
+    except FileNotFoundError:
+        return 0
+    except OSError as e:
+        logger.warning(f"Failed to clean up file {file_path}: {str(e)}")
+        return 0
+
 @shared_task
 def cleanup_temp_files(file_paths: List[str]):
     """Clean up temporary files after report distribution"""
     try:
-        cleaned_count = 0
-        for file_path in file_paths:
-            try:
-                if os.path.exists(file_path) and 'temp_' in os.path.basename(file_path):
-                    os.remove(file_path)
-                    cleaned_count += 1
-            except Exception as e:
-                logger.warning(f"Failed to clean up file {file_path}: {str(e)}")
+        # unlink releases the GIL, so a small pool overlaps the filesystem calls
+        with ThreadPoolExecutor(max_workers=TEMP_FILE_CLEANUP_WORKERS) as executor:
+            cleaned_count = sum(executor.map(_remove_temp_file, file_paths))
         
         logger.info(f"Cleaned up {cleaned_count} temporary files.")
         
@@ -344,11 +503,11 @@ def cleanup_temp_files(file_paths: List[str]):
 def generate_adhoc_report(report_type: str, config: Dict[str, Any]):
     """Generate an ad-hoc report (not scheduled)"""
     try:
-        generator = ReportGenerator()
+        generator = get_report_generator()
         generation_result = generator.generate_report(config)
         
         if config.get('distribute', False):
-            distributor = DistributionService()
+            distributor = get_distribution_service()
             distribution_result = distributor.distribute_report(config, generation_result['files'])
             
             return {
@@ -370,32 +529,82 @@ def generate_adhoc_report(report_type: str, config: Dict[str, Any]):
         }
 
 
+def _fetch_dicts(cursor):
+    """Return the cursor's rows as dicts keyed by column name"""
+    columns = [col[0] for col in cursor.description]
+    return [dict(zip(columns, row)) for row in cursor.fetchall()]
+
+
+def _cache_rows(key, rows, ttl=AGGREGATE_CACHE_TTL):
+    """Store rows as JSON and set their expiry in a single round trip"""
+    # Raw client from the configured cache's connection pool, so the keys stay
+    # readable by name outside Django
+    pipe = get_redis_connection("default").pipeline()
+    pipe.set(key, json.dumps(rows, cls=DjangoJSONEncoder))
+    pipe.expire(key, ttl)
+    pipe.execute()
+
+
+def _refresh_and_cache_top(view, query, key):
+    """Refresh a materialized view and cache its top rows for today"""
+    with connection.cursor() as cursor:
+        cursor.execute(f"REFRESH MATERIALIZED VIEW CONCURRENTLY {view};")
+        cursor.execute(query)
+        rows = _fetch_dicts(cursor)
+    _cache_rows(key, rows)
+    return rows
+
 @shared_task
 def aggregate_mints():
     """Aggregate daily NFT mint count by collection and store in materialized view and Redis."""
     try:
-        with connection.cursor() as cursor:
-            cursor.execute("REFRESH MATERIALIZED VIEW CONCURRENTLY daily_mint_count_by_collection;")
-        redis_client = Redis()
-        # Example: cache top collections by mint count
-        cursor.execute("SELECT collection, mint_count FROM daily_mint_count_by_collection WHERE date = CURRENT_DATE ORDER BY mint_count DESC LIMIT 10;")
-        top_collections = cursor.fetchall()
-        redis_client.set('top_mint_collections', str(top_collections))
+        top_collections = _refresh_and_cache_top(
+            "daily_mint_count_by_collection",
+            "SELECT collection, mint_count FROM daily_mint_count_by_collection WHERE date = CURRENT_DATE ORDER BY mint_count DESC LIMIT 10;",
+            'top_mint_collections',
+        )
         return {'status': 'success', 'top_collections': top_collections}
     except Exception as e:
         logger.error(f"Mint aggregation failed: {str(e)}")
         return {'status': 'error', 'message': str(e)}
 
+# Re-rolls only the open days (yesterday and today) of sales_events into
+# sales_aggregates instead of recomputing every day on each run
+SALES_ROLLUP_SQL = """
+    INSERT INTO sales_aggregates (
+        date, contract_address, total_sales, total_volume, average_price,
+        min_price, max_price, unique_buyers, unique_sellers,
+        total_marketplace_fees, total_royalty_fees, created_at, updated_at
+    )
+    SELECT
+        timestamp::date, contract_address, COUNT(*), SUM(sale_price), AVG(sale_price),
+        MIN(sale_price), MAX(sale_price), COUNT(DISTINCT buyer_address), COUNT(DISTINCT seller_address),
+        SUM(marketplace_fee), SUM(royalty_fee), NOW(), NOW()
+    FROM sales_events
+    WHERE timestamp >= CURRENT_DATE - 1
+    GROUP BY timestamp::date, contract_address
+    ON CONFLICT (date, contract_address) DO UPDATE SET
+        total_sales = EXCLUDED.total_sales,
+        total_volume = EXCLUDED.total_volume,
+        average_price = EXCLUDED.average_price,
+        min_price = EXCLUDED.min_price,
+        max_price = EXCLUDED.max_price,
+        unique_buyers = EXCLUDED.unique_buyers,
+        unique_sellers = EXCLUDED.unique_sellers,
+        total_marketplace_fees = EXCLUDED.total_marketplace_fees,
+        total_royalty_fees = EXCLUDED.total_royalty_fees,
+        updated_at = EXCLUDED.updated_at;
+"""
+
 @shared_task
 def aggregate_sales():
-    """Aggregate daily NFT sales volume rollups and store in materialized view and Redis."""
+    """Roll up the open days of sales into SalesAggregate and cache today's top collections in Redis."""
     try:
         with connection.cursor() as cursor:
-            cursor.execute("REFRESH MATERIALIZED VIEW CONCURRENTLY daily_sales_volume_rollup;")
-        redis_client = Redis()
-        cursor.execute("SELECT collection, total_sales FROM daily_sales_volume_rollup WHERE date = CURRENT_DATE ORDER BY total_sales DESC LIMIT 10;")
-        top_sales = cursor.fetchall()
-        redis_client.set('top_sales_collections', str(top_sales))
+            cursor.execute(SALES_ROLLUP_SQL)
+            cursor.execute("SELECT contract_address AS collection, total_sales, total_volume FROM sales_aggregates WHERE date = CURRENT_DATE ORDER BY total_sales DESC LIMIT 10;")
+            top_sales = _fetch_dicts(cursor)
+        _cache_rows('top_sales_collections', top_sales)
         return {'status': 'success', 'top_sales': top_sales}
     except Exception as e:
         logger.error(f"Sales aggregation failed: {str(e)}")
@@ -405,12 +614,11 @@ def aggregate_sales():
 def aggregate_user_activity():
     """Aggregate daily user activity summaries and store in materialized view and Redis."""
     try:
-        with connection.cursor() as cursor:
-            cursor.execute("REFRESH MATERIALIZED VIEW CONCURRENTLY daily_user_activity_summary;")
-        redis_client = Redis()
-        cursor.execute("SELECT user_id, activity_score FROM daily_user_activity_summary WHERE date = CURRENT_DATE ORDER BY activity_score DESC LIMIT 10;")
-        top_users = cursor.fetchall()
-        redis_client.set('top_active_users', str(top_users))
+        top_users = _refresh_and_cache_top(
+            "daily_user_activity_summary",
+            "SELECT user_id, activity_score FROM daily_user_activity_summary WHERE date = CURRENT_DATE ORDER BY activity_score DESC LIMIT 10;",
+            'top_active_users',
+        )
         return {'status': 'success', 'top_users': top_users}
     except Exception as e:
         logger.error(f"User activity aggregation failed: {str(e)}")
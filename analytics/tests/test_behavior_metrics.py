@@ -0,0 +1,101 @@
+from datetime import timedelta
+from unittest import mock
+
+from django.contrib.admin.sites import AdminSite
+from django.contrib.auth import get_user_model
+from django.test import RequestFactory, TestCase
+from django.utils import timezone
+
+from ..admin import UserBehaviorMetricsAdmin
+from ..models import UserBehaviorMetrics, UserSession, WalletConnection
+
+User = get_user_model()
+
+
+class UserBehaviorMetricsRefreshTests(TestCase):
+    def setUp(self):
+        self.now = timezone.now()
+        self.user = User.objects.create_user(
+            wallet_address='0x' + '01' * 32,
+            email='metrics@example.com',
+            password='testpass123'
+        )
+        self.other = User.objects.create_user(
+            wallet_address='0x' + '02' * 32,
+            email='other@example.com',
+            password='testpass123'
+        )
+
+        self._session(self.user, days_ago=10, minutes=30)
+        self._session(self.user, days_ago=3, minutes=90)
+        self._session(self.user, days_ago=1, minutes=None)  # still open
+        self._session(self.other, days_ago=2, minutes=15)
+
+        for provider, status in [
+            ('metamask', 'success'),
+            ('metamask', 'success'),
+            ('coinbase', 'success'),
+            ('coinbase', 'failed'),
+            ('phantom', 'cancelled'),
+        ]:
+            WalletConnection.objects.create(
+                user=self.user,
+                wallet_provider=provider,
+                connection_status=status,
+                ip_address='127.0.0.1',
+            )
+
+        self.metrics = [
+            UserBehaviorMetrics.objects.create(
+                user=user, first_login=self.now, last_login=self.now
+            )
+            for user in (self.user, self.other)
+        ]
+
+    def _session(self, user, days_ago, minutes):
+        login_at = self.now - timedelta(days=days_ago)
+        session = UserSession.objects.create(user=user, ip_address='127.0.0.1')
+        UserSession.objects.filter(pk=session.pk).update(
+            login_at=login_at,
+            logout_at=login_at + timedelta(minutes=minutes) if minutes is not None else None,
+        )
+
+    def _snapshot(self, metrics):
+        metrics.refresh_from_db()
+        return {
+            field: getattr(metrics, field)
+            for field in UserBehaviorMetrics.METRIC_FIELDS
+            if field != 'last_updated'
+        }
+
+    def test_refresh_many_computes_metrics(self):
+        UserBehaviorMetrics.refresh_many(UserBehaviorMetrics.objects.all())
+
+        snapshot = self._snapshot(self.metrics[0])
+        self.assertEqual(snapshot['total_sessions'], 3)
+        self.assertEqual(snapshot['total_session_time'], timedelta(minutes=120))
+        self.assertEqual(snapshot['average_session_duration'], timedelta(minutes=60))
+        self.assertEqual(snapshot['days_since_first_login'], 10)
+        self.assertTrue(snapshot['is_returning_user'])
+        self.assertEqual(snapshot['preferred_wallet'], 'metamask')
+        self.assertEqual(snapshot['successful_wallet_connections'], 3)
+        self.assertEqual(snapshot['failed_wallet_connections'], 1)
+
+        other = self._snapshot(self.metrics[1])
+        self.assertEqual(other['total_sessions'], 1)
+        self.assertFalse(other['is_returning_user'])
+        self.assertEqual(other['preferred_wallet'], '')
+
+    def test_admin_action_matches_instance_method(self):
+        for metrics in self.metrics:
+            metrics.update_metrics()
+        expected = [self._snapshot(metrics) for metrics in self.metrics]
+
+        UserBehaviorMetrics.objects.update(total_sessions=0, preferred_wallet='')
+
+        model_admin = UserBehaviorMetricsAdmin(UserBehaviorMetrics, AdminSite())
+        request = RequestFactory().post('/')
+        with mock.patch.object(model_admin, 'message_user'):
+            model_admin.update_metrics(request, UserBehaviorMetrics.objects.all())
+
+        self.assertEqual([self._snapshot(metrics) for metrics in self.metrics], expected)
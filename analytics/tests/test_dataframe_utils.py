@@ -0,0 +1,51 @@
+from datetime import date
+from decimal import Decimal
+
+from django.test import TestCase
+
+from ..aggregations.utils import queryset_to_dataframe
+from ..models import RetentionCohort
+
+
+class QuerysetToDataFrameTests(TestCase):
+    FIELDS = ['id', 'period_number', 'retained_users', 'retention_rate']
+
+    def setUp(self):
+        self.cohorts = [
+            RetentionCohort.objects.create(
+                cohort_date=date(2024, 1, 1),
+                period_type='daily',
+                period_number=n,
+                total_users=100,
+                retained_users=100 - n * 10,
+                retention_rate=Decimal(100 - n * 10),
+            )
+            for n in range(5)
+        ]
+
+    def test_streams_rows_across_chunks(self):
+        qs = RetentionCohort.objects.order_by('period_number')
+        df = queryset_to_dataframe(qs, fields=self.FIELDS, chunk_size=2)
+
+        self.assertEqual(list(df.index), [c.id for c in self.cohorts])
+        self.assertEqual(list(df.columns), ['period_number', 'retained_users', 'retention_rate'])
+        self.assertEqual(list(df['retained_users']), [100, 90, 80, 70, 60])
+
+    def test_decimal_columns_become_numeric(self):
+        df = queryset_to_dataframe(RetentionCohort.objects.order_by('id'), fields=self.FIELDS)
+
+        self.assertEqual(df['retention_rate'].dtype.kind, 'f')
+        self.assertEqual(list(df['retention_rate']), [100.0, 90.0, 80.0, 70.0, 60.0])
+
+    def test_defaults_to_all_concrete_fields(self):
+        df = queryset_to_dataframe(RetentionCohort.objects.all())
+
+        self.assertEqual(len(df), 5)
+        self.assertIn('retention_bucket', df.columns)
+        self.assertEqual(df.index.name, 'id')
+
+    def test_empty_queryset_keeps_columns(self):
+        df = queryset_to_dataframe(RetentionCohort.objects.none(), fields=self.FIELDS)
+
+        self.assertTrue(df.empty)
+        self.assertEqual(list(df.columns), ['period_number', 'retained_users', 'retention_rate'])
@@ -0,0 +1,36 @@
+from datetime import datetime, timedelta, timezone as dt_timezone
+from unittest import mock
+
+from django.test import SimpleTestCase
+
+from ..models import AutomatedReport
+
+
+def _at(year, month, day, hour=9):
+    return datetime(year, month, day, hour, 30, tzinfo=dt_timezone.utc)
+
+
+class CalculateNextRunTests(SimpleTestCase):
+    def _next_run(self, frequency, last_run):
+        report = AutomatedReport(frequency=frequency, last_run=last_run)
+        report.calculate_next_run()
+        return report.next_run
+
+    def test_daily_and_weekly_keep_time_of_day(self):
+        last_run = _at(2024, 3, 10)
+        self.assertEqual(self._next_run('daily', last_run), last_run + timedelta(days=1))
+        self.assertEqual(self._next_run('weekly', last_run), last_run + timedelta(weeks=1))
+
+    def test_monthly_lands_on_same_day_next_month(self):
+        self.assertEqual(self._next_run('monthly', _at(2024, 3, 15)), _at(2024, 4, 15))
+        self.assertEqual(self._next_run('monthly', _at(2024, 12, 15)), _at(2025, 1, 15))
+
+    def test_monthly_clamps_to_month_end(self):
+        self.assertEqual(self._next_run('monthly', _at(2023, 1, 31)), _at(2023, 2, 28))
+        self.assertEqual(self._next_run('monthly', _at(2024, 1, 31)), _at(2024, 2, 29))
+        self.assertEqual(self._next_run('monthly', _at(2024, 3, 31)), _at(2024, 4, 30))
+
+    def test_never_run_report_is_due_now(self):
+        now = _at(2024, 5, 1)
+        with mock.patch('analytics.models.timezone.now', return_value=now):
+            self.assertEqual(self._next_run('monthly', None), now)
@@ -0,0 +1,85 @@
+from django.contrib.admin.sites import AdminSite
+from django.contrib.auth import get_user_model
+from django.test import RequestFactory, SimpleTestCase, TestCase
+
+from ..admin import WalletConnectionAdmin
+from ..models import WalletConnection
+
+User = get_user_model()
+
+ADDRESS = '0x' + 'Ab' * 20
+
+
+class AddressToBytesTests(SimpleTestCase):
+    def test_decodes_full_address(self):
+        self.assertEqual(WalletConnection.address_to_bytes(ADDRESS), bytes([0xab] * 20))
+
+    def test_rejects_malformed_addresses(self):
+        for address in [
+            '',
+            None,
+            'Ab' * 20,              # missing 0x
+            '0x12 34',              # separators
+            '0x1234',               # too short
+            '0x' + 'ab' * 32,       # too long
+            '0x' + 'zz' * 20,       # not hex
+            ADDRESS + '\n',         # trailing newline
+        ]:
+            with self.subTest(address=address):
+                self.assertIsNone(WalletConnection.address_to_bytes(address))
+
+
+class WalletAddressBinTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            wallet_address='0x' + '01' * 32,
+            email='wallet@example.com',
+            password='testpass123'
+        )
+
+    def _connection(self, address):
+        return WalletConnection(
+            user=self.user,
+            wallet_provider='metamask',
+            connection_status='success',
+            wallet_address=address,
+            ip_address='127.0.0.1',
+        )
+
+    def _stored_bin(self, connection):
+        value = WalletConnection.objects.values_list('wallet_address_bin', flat=True).get(pk=connection.pk)
+        return bytes(value) if value is not None else None
+
+    def test_matches_address_to_bytes_on_every_write_path(self):
+        saved = self._connection(ADDRESS)
+        saved.save()
+        bulk, malformed = WalletConnection.objects.bulk_create(
+            [self._connection('0x' + 'cd' * 20), self._connection('0x12 34')]
+        )
+
+        self.assertEqual(self._stored_bin(saved), WalletConnection.address_to_bytes(ADDRESS))
+        self.assertEqual(self._stored_bin(bulk), bytes([0xcd] * 20))
+        self.assertIsNone(self._stored_bin(malformed))
+
+        WalletConnection.objects.filter(pk=malformed.pk).update(wallet_address='0x' + 'ef' * 20)
+        self.assertEqual(self._stored_bin(malformed), bytes([0xef] * 20))
+
+    def test_admin_search_matches_full_and_partial_addresses(self):
+        match = self._connection(ADDRESS)
+        match.save()
+        self._connection('0x' + 'cd' * 20).save()
+
+        model_admin = WalletConnectionAdmin(WalletConnection, AdminSite())
+        request = RequestFactory().get('/')
+        for term in [ADDRESS, ADDRESS.lower(), ADDRESS[:10]]:
+            with self.subTest(term=term):
+                results, _ = model_admin.get_search_results(
+                    request, WalletConnection.objects.all(), term
+                )
+                self.assertEqual(list(results), [match])
+
+    def test_admin_short_address_keeps_checksum_case(self):
+        connection = self._connection('0x5aAeb6053F3E94C9b9A09f33669435E7Ef1BeAed')
+        model_admin = WalletConnectionAdmin(WalletConnection, AdminSite())
+
+        self.assertEqual(model_admin.wallet_address_short(connection), '0x5aAe...eAed')
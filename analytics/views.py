@@ -43,7 +43,11 @@ class AnalyzeMetadataView(APIView):
             return Response({
                 'status': 'success',
                 'data': {
+                    # Inline only when it could not be archived; otherwise
+                    # the blob is at metadata_uri
                     'metadata': nft_meta.raw_metadata,
+                    'metadata_digest': nft_meta.raw_metadata_digest,
+                    'metadata_uri': nft_meta.raw_metadata_uri,
                     'analysis': {
                         'content_type': nft_meta.content_type,
                         'authenticity_score': nft_meta.authenticity_score,
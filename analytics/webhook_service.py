@@ -1,4 +1,5 @@
 import requests
+from requests.adapters import HTTPAdapter
 import hashlib
 import hmac
 import json
@@ -9,6 +10,13 @@ import logging
 logger = logging.getLogger(__name__)
 
 class WebhookService:
+    def __init__(self):
+        # One pooled session per service so repeated deliveries reuse TCP/TLS connections
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=20, pool_maxsize=50)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+    
     def send_anomaly_alert(self, anomaly: AnomalyDetection):
         """Send anomaly alert to all configured webhooks"""
         
@@ -39,7 +47,7 @@ class WebhookService:
                 signature = self._create_signature(payload, webhook.secret_key)
                 headers['X-Signature-SHA256'] = signature
             
-            response = requests.post(
+            response = self.session.post(
                 webhook.url,
                 data=json.dumps(payload),
                 headers=headers,
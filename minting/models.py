@@ -1,6 +1,5 @@
 from django.db import models
-from django.db.models.signals import post_save, post_delete
-from django.dispatch import receiver
+from django.contrib.postgres.indexes import BrinIndex
 
 class MintingEvent(models.Model):
     """Model to track NFT minting events"""
@@ -17,27 +16,12 @@ class MintingEvent(models.Model):
     class Meta:
         db_table = 'minting_events'
         ordering = ['-timestamp']
+        indexes = [
+            BrinIndex(fields=['timestamp'], pages_per_range=128, name='minting_ts_brin'),
+        ]
     
     def __str__(self):
         return f"Mint {self.token_id} by {self.minter_address[:10]}..."
 
-# Signal handlers for cache invalidation
-@receiver(post_save, sender=MintingEvent)
-def invalidate_minting_cache_on_save(sender, instance, **kwargs):
-    """Invalidate minting cache when new minting event is saved"""
-    try:
-        from apps.cache.redis_utils import invalidate_minting_cache
-        invalidate_minting_cache()
-    except ImportError:
-        # Cache utils not available yet during initial setup
-        pass
-
-@receiver(post_delete, sender=MintingEvent)
-def invalidate_minting_cache_on_delete(sender, instance, **kwargs):
-    """Invalidate minting cache when minting event is deleted"""
-    try:
-        from apps.cache.redis_utils import invalidate_minting_cache
-        invalidate_minting_cache()
-    except ImportError:
-        # Cache utils not available yet during initial setup
-        pass
\ No newline at end of file
+# Cache invalidation is driven by the notify trigger on minting_events; see the
+# listen_cache_invalidations management command.
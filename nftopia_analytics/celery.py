@@ -0,0 +1,37 @@
+import os
+from celery import Celery
+from celery.signals import worker_process_init
+from prometheus_client import start_http_server
+
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'nftopia_analytics.settings')
+app = Celery('nftopia_analytics')
+app.config_from_object('django.conf:settings', namespace='CELERY')
+app.autodiscover_tasks()
+
+from nftopia_analytics.monitoring.exporters import update_celery_metrics
+
+
+@worker_process_init.connect
+def start_metrics_server(**kwargs):
+    start_http_server(8001)  # Expose on port 8001
+
+
+@worker_process_init.connect
+def init_task_services(**kwargs):
+    """Build the per-process services once, right after the worker forks"""
+    from analytics.tasks import get_distribution_service, get_report_generator, get_webhook_service
+
+    get_webhook_service()
+    get_report_generator()
+    get_distribution_service()
+
+
+@app.task(name='monitoring.tasks.update_metrics')
+def update_metrics():
+    update_celery_metrics()
+
+
+@app.on_after_configure.connect
+def setup_periodic_tasks(sender, **kwargs):
+    # Periodic metric updates; added to CELERY_BEAT_SCHEDULE instead of replacing it
+    sender.add_periodic_task(15.0, update_metrics.s(), name='update-metrics')
@@ -245,6 +245,22 @@ CELERY_TASK_SERIALIZER = 'json'
 CELERY_RESULT_SERIALIZER = 'json'
 CELERY_TIMEZONE = 'UTC'
 
+# CPU-bound report rendering runs on its own workers (celery -Q reports), and
+# IPFS analysis on its own queue so its rate limit doesn't hold up other tasks
+from kombu import Queue
+
+CELERY_TASK_DEFAULT_QUEUE = 'default'
+CELERY_TASK_QUEUES = (
+    Queue('default'),
+    Queue('reports'),
+    Queue('ipfs'),
+)
+CELERY_TASK_ROUTES = {
+    'analytics.tasks.generate_single_report_task': {'queue': 'reports'},
+    'analytics.tasks.generate_adhoc_report': {'queue': 'reports'},
+    'analytics.tasks.analyze_nft_metadata': {'queue': 'ipfs'},
+}
+
 WEBHOOK_SECRET = 'your-secret-key'  # In production, use environment variables
 
 # Celery Beat Schedule for automated reports
@@ -286,6 +302,7 @@ DEFAULT_FROM_EMAIL = os.getenv('DEFAULT_FROM_EMAIL', 'noreply@nftopia.com')
 AWS_ACCESS_KEY_ID = os.getenv('AWS_ACCESS_KEY_ID', '')
 AWS_SECRET_ACCESS_KEY = os.getenv('AWS_SECRET_ACCESS_KEY', '')
 AWS_S3_REGION_NAME = os.getenv('AWS_S3_REGION_NAME', 'us-east-1')
+NFT_METADATA_S3_BUCKET = os.getenv('NFT_METADATA_S3_BUCKET', 'analytics-raw')
 
 # Report Generation Settings
 REPORT_SETTINGS = {
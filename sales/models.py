@@ -1,7 +1,5 @@
 from django.db import models
-from django.db.models.signals import post_save, post_delete
-from django.dispatch import receiver
-from django.core.exceptions import ValidationError
+from django.contrib.postgres.indexes import BrinIndex
 from decimal import Decimal
 from django.utils.translation import gettext_lazy as _
 import uuid
@@ -24,7 +22,7 @@ class SalesEvent(models.Model):
     # Transaction Details
     transaction_hash = models.CharField(max_length=66, unique=True)
     block_number = models.BigIntegerField(db_index=True)
-    timestamp = models.DateTimeField(auto_now_add=True, db_index=True)
+    timestamp = models.DateTimeField(auto_now_add=True)
     gas_used = models.BigIntegerField(null=True, blank=True)
     gas_price = models.DecimalField(max_digits=20, decimal_places=18, null=True, blank=True)
     
@@ -45,23 +43,20 @@ class SalesEvent(models.Model):
             models.Index(fields=['seller_address', 'timestamp']),
             models.Index(fields=['buyer_address', 'timestamp']),
             models.Index(fields=['marketplace', 'timestamp']),
+            # Rows arrive in timestamp order, so a BRIN index covers range scans
+            # at a fraction of a B-tree's size
+            BrinIndex(fields=['timestamp'], pages_per_range=128, name='sales_ts_brin'),
+        ]
+        constraints = [
+            # Enforced by the database so bulk_create ingestion is validated too
+            models.CheckConstraint(
+                condition=models.Q(sale_price__gt=0)
+                & models.Q(marketplace_fee__gte=0)
+                & models.Q(royalty_fee__gte=0),
+                name='sales_event_prices_valid',
+                violation_error_message="Sale price must be greater than 0 and fees cannot be negative",
+            ),
         ]
-    
-    def clean(self):
-        """Validate model data"""
-        if self.sale_price <= 0:
-            raise ValidationError("Sale price must be greater than 0")
-        
-        if self.marketplace_fee < 0:
-            raise ValidationError("Marketplace fee cannot be negative")
-        
-        if self.royalty_fee < 0:
-            raise ValidationError("Royalty fee cannot be negative")
-    
-    def save(self, *args, **kwargs):
-        """Override save to include validation"""
-        self.clean()
-        super().save(*args, **kwargs)
     
     @property
     def net_sale_price(self):
@@ -106,63 +101,8 @@ class SalesAggregate(models.Model):
     def __str__(self):
         return f"Sales Aggregate {self.date} - {self.contract_address[:10]}..."
 
-# Signal handlers for cache invalidation
-@receiver(post_save, sender=SalesEvent)
-def invalidate_sales_cache_on_save(sender, instance, **kwargs):
-    """Invalidate sales cache when new sales event is saved"""
-    try:
-        from apps.cache.redis_utils import invalidate_sales_cache
-        invalidate_sales_cache()
-    except ImportError:
-        # Cache utils not available yet during initial setup
-        pass
-    except Exception as e:
-        # Log error but don't break the save operation
-        import logging
-        logger = logging.getLogger(__name__)
-        logger.error(f"Failed to invalidate sales cache: {str(e)}")
-
-@receiver(post_delete, sender=SalesEvent)
-def invalidate_sales_cache_on_delete(sender, instance, **kwargs):
-    """Invalidate sales cache when sales event is deleted"""
-    try:
-        from apps.cache.redis_utils import invalidate_sales_cache
-        invalidate_sales_cache()
-    except ImportError:
-        # Cache utils not available yet during initial setup
-        pass
-    except Exception as e:
-        # Log error but don't break the delete operation
-        import logging
-        logger = logging.getLogger(__name__)
-        logger.error(f"Failed to invalidate sales cache: {str(e)}")
-
-@receiver(post_save, sender=SalesAggregate)
-def invalidate_sales_cache_on_aggregate_save(sender, instance, **kwargs):
-    """Invalidate sales cache when sales aggregate is updated"""
-    try:
-        from apps.cache.redis_utils import invalidate_sales_cache
-        invalidate_sales_cache()
-    except ImportError:
-        pass
-    except Exception as e:
-        import logging
-        logger = logging.getLogger(__name__)
-        logger.error(f"Failed to invalidate sales cache on aggregate save: {str(e)}")
-
-@receiver(post_delete, sender=SalesAggregate)
-def invalidate_sales_cache_on_aggregate_delete(sender, instance, **kwargs):
-    """Invalidate sales cache when sales aggregate is deleted"""
-    try:
-        from apps.cache.redis_utils import invalidate_sales_cache
-        invalidate_sales_cache()
-    except ImportError:
-        pass
-    except Exception as e:
-        import logging
-        logger = logging.getLogger(__name__)
-        logger.error(f"Failed to invalidate sales cache on aggregate delete: {str(e)}")
-
+# Cache invalidation is driven by the notify triggers on sales_events and
+# sales_aggregates; see the listen_cache_invalidations management command.
 
 
 class Transaction(models.Model):
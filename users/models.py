@@ -1,8 +1,40 @@
 from django.db import models
-from django.contrib.auth.models import AbstractUser
+from django.contrib.auth.models import AbstractUser, BaseUserManager
 from django.utils.translation import gettext_lazy as _
 import uuid
 
+class UserManager(BaseUserManager):
+    """Creates users identified by their wallet address"""
+
+    use_in_migrations = True
+
+    def _create_user(self, wallet_address, email, password, **extra_fields):
+        if not wallet_address:
+            raise ValueError("The given wallet address must be set")
+        user = self.model(
+            wallet_address=wallet_address,
+            email=self.normalize_email(email),
+            **extra_fields
+        )
+        user.set_password(password)
+        user.save(using=self._db)
+        return user
+
+    def create_user(self, wallet_address, email=None, password=None, **extra_fields):
+        extra_fields.setdefault("is_staff", False)
+        extra_fields.setdefault("is_superuser", False)
+        return self._create_user(wallet_address, email, password, **extra_fields)
+
+    def create_superuser(self, wallet_address, email=None, password=None, **extra_fields):
+        extra_fields.setdefault("is_staff", True)
+        extra_fields.setdefault("is_superuser", True)
+        if extra_fields.get("is_staff") is not True:
+            raise ValueError("Superuser must have is_staff=True.")
+        if extra_fields.get("is_superuser") is not True:
+            raise ValueError("Superuser must have is_superuser=True.")
+        return self._create_user(wallet_address, email, password, **extra_fields)
+
+
 class User(AbstractUser):
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
     wallet_address = models.CharField(
@@ -30,6 +62,8 @@ class User(AbstractUser):
     USERNAME_FIELD = 'wallet_address'
     REQUIRED_FIELDS = []
 
+    objects = UserManager()
+
     class Meta:
         verbose_name = _('user')
         verbose_name_plural = _('users')